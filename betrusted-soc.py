@@ -1448,7 +1448,8 @@ class BetrustedSoC(SoCCore):
             # NOTE: ECSn is deliberately not constrained -- it's more or less async (0-10ns delay on the signal, only meant to line up with "block" region
 
             # constrain DQS-to-DQ input DDR delays
-            self.platform.add_platform_command("create_clock -name spidqs -period 10 [get_ports spiflash_8x_dqs]")
+            # DQS is the flash's echo of SCLK, which runs off the spinor clock (same frequency as sys_clk)
+            self.platform.add_platform_command("create_clock -name spidqs -period {:0.3f} [get_ports spiflash_8x_dqs]".format(1e9 / sys_clk_freq))
             self.platform.add_platform_command("set_input_delay -clock spidqs -max 0.6 [get_ports {{spiflash_8x_dq[*]}}]")
             self.platform.add_platform_command("set_input_delay -clock spidqs -min -0.6 [get_ports {{spiflash_8x_dq[*]}}]")
             self.platform.add_platform_command("set_input_delay -clock spidqs -max 0.6 [get_ports {{spiflash_8x_dq[*]}}] -clock_fall -add_delay")
@@ -1478,9 +1479,16 @@ class BetrustedSoC(SoCCore):
             # constrain CLK-to-CS output delay. NOTE: timings require one dummy cycle insertion between CS and SCLK (de)activations. Not possible to meet timing for DQ & single-cycle CS due to longer tS/tH reqs for CS
             self.platform.add_platform_command("set_output_delay -clock [get_clocks spiclk_out] -min -1 [get_ports spiflash_8x_cs_n]") # -3 in reality
             self.platform.add_platform_command("set_output_delay -clock [get_clocks spiclk_out] -max 1 [get_ports spiflash_8x_cs_n]")  # 4.5 in reality
+            # keep SCLK_ODDR from being renamed/merged by opt_design: spiclk_out above is defined on its Q pin
+            self.platform.add_platform_command("set_property DONT_TOUCH TRUE [get_cells {}]".format(sclk_instance_name))
+            # S7SPIOPI doesn't expose a name for the CS_n output cell, so ask for IOB packing of whatever register drives the port
+            self.platform.add_platform_command("set_property IOB TRUE [get_ports spiflash_8x_cs_n]")
             # unconstrain OE path - we have like 10+ dummy cycles to turn the bus on wr->rd, and 2+ cycles to turn on end of read
             self.platform.add_platform_command("set_false_path -through [ get_pins s7spiopi_dq_copi_oe_reg/Q ]")
             self.platform.add_platform_command("set_false_path -through [ get_pins s7spiopi_dq_oe_reg/Q ]")
+            # tie the SpiOpi IDELAYE2 lanes to the CRG's IDELAYCTRL; no effect while it's the only IDELAYCTRL, but keeps the lanes
+            # bound to the 200MHz-referenced controller if a second IDELAYCTRL/refclk is ever added
+            self.platform.add_platform_command("set_property IODELAY_GROUP spinor [get_cells -hierarchical -filter {{REF_NAME == IDELAYCTRL || REF_NAME == IDELAYE2}}]")
 
         self.register_mem("spiflash", self.mem_map["spiflash"], self.spinor.bus, size=SPI_FLASH_SIZE)
         self.add_csr("spinor")